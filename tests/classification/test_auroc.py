@@ -16,6 +16,7 @@ from functools import partial
 import pytest
 import torch
 from sklearn.metrics import roc_auc_score as sk_roc_auc_score
+from sklearn.preprocessing import label_binarize
 
 from tests.classification.inputs import _input_binary_prob
 from tests.classification.inputs import _input_multiclass_prob as _input_mcls_prob
@@ -25,7 +26,7 @@ from tests.classification.inputs import _input_multilabel_prob as _input_mlb_pro
 from tests.helpers import seed_all
 from tests.helpers.testers import NUM_CLASSES, MetricTester
 from torchmetrics.classification.auroc import AUROC
-from torchmetrics.functional import auroc
+from torchmetrics.functional import auroc, roc
 from torchmetrics.utilities.imports import _TORCH_LOWER_1_6
 
 seed_all(42)
@@ -216,3 +217,31 @@ def test_weighted_with_empty_classes():
     target = torch.zeros_like(target)
     with pytest.raises(ValueError, match="Found 1 non-empty class in `multiclass` AUROC calculation"):
         _ = auroc(preds, target, average="weighted", num_classes=num_classes + 1)
+
+
+@pytest.mark.parametrize("average", [None, "macro", "weighted"])
+def test_multiclass_tied_predictions(average):
+    """Tests the per-class AUROC when ties make the roc curves of the classes differ in length."""
+    preds = torch.tensor(
+        [
+            [0.50, 0.25, 0.25],
+            [0.25, 0.50, 0.25],
+            [0.25, 0.25, 0.50],
+            [0.50, 0.25, 0.25],
+            [0.25, 0.50, 0.25],
+            [0.30, 0.20, 0.50],
+        ]
+    )
+    target = torch.tensor([0, 1, 2, 0, 1, 2])
+    num_classes = 3
+
+    fpr, _, _ = roc(preds, target, num_classes=num_classes)
+    assert len({x.numel() for x in fpr}) > 1
+
+    result = auroc(preds, target, num_classes=num_classes, average=average)
+    sk_result = sk_roc_auc_score(
+        y_true=label_binarize(target.numpy(), classes=list(range(num_classes))),
+        y_score=preds.numpy(),
+        average=average,
+    )
+    assert torch.allclose(result, torch.tensor(sk_result, dtype=result.dtype))
@@ -32,6 +32,12 @@ from tests.helpers import seed_all
 from tests.helpers.testers import NUM_CLASSES, THRESHOLD, MetricTester
 from torchmetrics.classification.confusion_matrix import ConfusionMatrix
 from torchmetrics.functional import confusion_matrix
+from torchmetrics.functional.classification.confusion_matrix import (
+    _confusion_matrix_compute,
+    _confusion_matrix_update,
+)
+from torchmetrics.utilities.checks import _input_format_classification
+from torchmetrics.utilities.enums import DataType
 
 seed_all(42)
 
@@ -183,6 +189,85 @@ def test_warning_on_nan(tmpdir):
 
     with pytest.warns(
         UserWarning,
-        match=".* nan values found in confusion matrix have been replaced with zeros.",
+        match=".* elements of the confusion matrix belong to rows/columns that sum to zero",
     ):
         confusion_matrix(preds, target, num_classes=5, normalize="true")
+
+
+def _confusion_matrix_update_one_hot(preds, target, num_classes, threshold, multilabel):
+    """Reference update which takes the labels from the one-hot output of ``_input_format_classification``."""
+    preds, target, mode = _input_format_classification(preds, target, threshold)
+    if mode not in (DataType.BINARY, DataType.MULTILABEL):
+        preds = preds.argmax(dim=1)
+        target = target.argmax(dim=1)
+    if multilabel:
+        unique_mapping = ((2 * target + preds) + 4 * torch.arange(num_classes, device=preds.device)).flatten()
+        return torch.bincount(unique_mapping, minlength=4 * num_classes).reshape(num_classes, 2, 2)
+    unique_mapping = (target.view(-1) * num_classes + preds.view(-1)).to(torch.long)
+    return torch.bincount(unique_mapping, minlength=num_classes ** 2).reshape(num_classes, num_classes)
+
+
+@pytest.mark.parametrize("half", [False, True])
+@pytest.mark.parametrize(
+    "preds, target, num_classes, multilabel",
+    [
+        (_input_binary_prob.preds[0], _input_binary_prob.target[0], 2, False),
+        (_input_binary.preds[0], _input_binary.target[0], 2, False),
+        (_input_mlb_prob.preds[0], _input_mlb_prob.target[0], NUM_CLASSES, True),
+        (_input_mlb.preds[0], _input_mlb.target[0], NUM_CLASSES, True),
+        (_input_mcls_prob.preds[0], _input_mcls_prob.target[0], NUM_CLASSES, False),
+        (_input_mcls.preds[0], _input_mcls.target[0], NUM_CLASSES, False),
+        (_input_mdmc_prob.preds[0], _input_mdmc_prob.target[0], NUM_CLASSES, False),
+        (_input_mdmc.preds[0], _input_mdmc.target[0], NUM_CLASSES, False),
+        # ties between the class probabilities
+        (torch.full((10, NUM_CLASSES), 1 / NUM_CLASSES), torch.randint(NUM_CLASSES, (10,)), NUM_CLASSES, False),
+    ],
+)
+def test_update_matches_one_hot_formatting(preds, target, num_classes, multilabel, half):
+    """Tests that taking the labels directly gives the same confusion matrix as the one-hot formatting."""
+    if half and preds.is_floating_point():
+        preds = preds.half()
+
+    confmat = _confusion_matrix_update(preds, target, num_classes, THRESHOLD, multilabel)
+    expected = _confusion_matrix_update_one_hot(preds, target, num_classes, THRESHOLD, multilabel)
+    assert torch.equal(confmat, expected)
+
+
+def test_non_contiguous_inputs():
+    """Tests that transposed (non-contiguous) inputs give the same result as contiguous ones."""
+    preds, target = _input_mdmc.preds[0].t(), _input_mdmc.target[0].t()
+    assert not preds.is_contiguous() and not target.is_contiguous()
+
+    confmat = confusion_matrix(preds, target, num_classes=NUM_CLASSES)
+    expected = confusion_matrix(preds.contiguous(), target.contiguous(), num_classes=NUM_CLASSES)
+    assert torch.equal(confmat, expected)
+
+
+@pytest.mark.parametrize(
+    "confmat, normalize, dim, num_empty",
+    [
+        # multi-class, empty row
+        (torch.tensor([[2, 1, 0], [0, 0, 0], [1, 0, 0]]), "true", 1, 3),
+        # multi-class, empty column
+        (torch.tensor([[2, 1, 0], [0, 0, 0], [1, 0, 0]]), "pred", 0, 3),
+        # multi-class, empty matrix
+        (torch.zeros(3, 3, dtype=torch.long), "all", None, 9),
+        # multi-label, empty row/column of the first class
+        (torch.tensor([[[1, 0], [2, 0]], [[3, 0], [0, 2]]]), "true", 1, 2),
+        (torch.tensor([[[1, 0], [2, 0]], [[3, 0], [0, 2]]]), "pred", 0, 2),
+        # multi-label, empty matrix
+        (torch.zeros(2, 2, 2, dtype=torch.long), "all", None, 8),
+    ],
+)
+def test_normalize_empty_rows_and_columns(confmat, normalize, dim, num_empty):
+    """Tests that empty rows/columns are normalized to zeros and that the warning reports their size."""
+    expected = confmat.float() / (confmat.sum() if dim is None else confmat.sum(dim, keepdim=True))
+    assert torch.isnan(expected).sum() == num_empty
+    expected[torch.isnan(expected)] = 0
+
+    with pytest.warns(
+        UserWarning,
+        match=f"^{num_empty} elements of the confusion matrix belong to rows/columns that sum to zero",
+    ):
+        result = _confusion_matrix_compute(confmat, normalize=normalize)
+    assert torch.equal(result, expected)
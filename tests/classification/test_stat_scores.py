@@ -32,6 +32,7 @@ from tests.helpers import seed_all
 from tests.helpers.testers import NUM_CLASSES, MetricTester
 from torchmetrics import StatScores
 from torchmetrics.functional import stat_scores
+from torchmetrics.functional.classification.stat_scores import _stat_scores
 from torchmetrics.utilities.checks import _input_format_classification
 
 seed_all(42)
@@ -321,3 +322,43 @@ def test_top_k(k: int, preds: Tensor, target: Tensor, reduce: str, expected: Ten
 
     assert torch.equal(class_metric.compute(), expected.T)
     assert torch.equal(stat_scores(preds, target, top_k=k, reduce=reduce, num_classes=3), expected.T)
+
+
+def _stat_scores_four_masks(preds, target, reduce):
+    """Reference implementation which builds a separate mask for each of the statistics."""
+    dim = 1
+    if reduce == "micro":
+        dim = [0, 1] if preds.ndim == 2 else [1, 2]
+    elif reduce == "macro":
+        dim = 0 if preds.ndim == 2 else 2
+
+    true_pred, false_pred = target == preds, target != preds
+    pos_pred, neg_pred = preds == 1, preds == 0
+
+    tp = (true_pred * pos_pred).sum(dim=dim)
+    fp = (false_pred * pos_pred).sum(dim=dim)
+    tn = (true_pred * neg_pred).sum(dim=dim)
+    fn = (false_pred * neg_pred).sum(dim=dim)
+    return tp, fp, tn, fn
+
+
+@pytest.mark.parametrize("reduce", ["micro", "macro", "samples"])
+@pytest.mark.parametrize(
+    "preds, target",
+    [
+        (_input_mcls_prob.preds[0], _input_mcls_prob.target[0]),
+        (_input_mdmc_prob.preds[0], _input_mdmc_prob.target[0]),
+        (torch.randint(2, (10, NUM_CLASSES)), torch.randint(2, (10, NUM_CLASSES))),
+        (torch.randint(2, (10, NUM_CLASSES, 4)), torch.randint(2, (10, NUM_CLASSES, 4))),
+    ],
+)
+def test_stat_scores_matches_four_masks(preds, target, reduce):
+    """Tests that deriving the statistics from tp and the mask sums matches counting each one separately."""
+    if preds.is_floating_point():
+        preds, target, _ = _input_format_classification(preds, target, num_classes=NUM_CLASSES)
+    assert preds.ndim in (2, 3)
+
+    results = _stat_scores(preds, target, reduce=reduce)
+    expected = _stat_scores_four_masks(preds, target, reduce)
+    for res, exp in zip(results, expected):
+        assert torch.equal(res, exp)
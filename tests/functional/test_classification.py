@@ -114,3 +114,32 @@ def test_binary_clf_curve(sample_weight, pos_label, exp_shape):
 def test_dice_score(pred, target, expected):
     score = dice_score(tensor(pred), tensor(target))
     assert score == expected
+
+
+@pytest.mark.parametrize("no_fg_score", [0.0, 0.5, 1.0])
+@pytest.mark.parametrize("bg", [True, False])
+def test_dice_score_no_foreground(bg, no_fg_score):
+    pred = tensor([[0.8, 0.1, 0.1], [0.1, 0.8, 0.1], [0.2, 0.7, 0.1]])
+    target = tensor([0, 1, 0])
+    expected = tensor([2 / 3, 2 / 3, no_fg_score])[1 - int(bg) :]
+
+    score = dice_score(pred, target, bg=bg, no_fg_score=no_fg_score, reduction="none")
+    assert torch.allclose(score, expected)
+
+
+@pytest.mark.parametrize("ignore_label", [-100, -1, 3, 255])
+def test_dice_score_out_of_range_target(ignore_label):
+    pred = tensor([[0.8, 0.1, 0.1], [0.1, 0.8, 0.1], [0.2, 0.7, 0.1]])
+    target = tensor([0, 1, ignore_label])
+
+    score = dice_score(pred, target, bg=True, reduction="none")
+    assert torch.allclose(score, tensor([1.0, 2 / 3, 0.0]))
+
+
+@pytest.mark.parametrize("ignore_label", [-100, -1, 3, 255])
+def test_dice_score_out_of_range_pred_labels(ignore_label):
+    pred = tensor([[0, 1, ignore_label], [0, 1, 1]])
+    target = tensor([[0, 1, 2], [0, 1, 1]])
+
+    score = dice_score(pred, target, bg=True, reduction="none")
+    assert torch.allclose(score, tensor([1.0, 1.0, 0.0]))
@@ -154,20 +154,23 @@ def _auroc_compute(
         if mode == DataType.MULTILABEL and average == AverageMethod.MICRO:
             pass
         elif num_classes != 1:
-            # calculate auc scores per class
-            auc_scores = [_auc_compute_without_check(x, y, 1.0) for x, y in zip(fpr, tpr)]
+            # calculate auc scores per class, batched if all curves have the same number of points
+            if len({x.numel() for x in fpr}) == 1:
+                auc_scores = _auc_compute_without_check(torch.stack(fpr), torch.stack(tpr), 1.0)
+            else:
+                auc_scores = torch.stack([_auc_compute_without_check(x, y, 1.0) for x, y in zip(fpr, tpr)])
 
             # calculate average
             if average == AverageMethod.NONE:
-                return tensor(auc_scores)
+                return auc_scores
             if average == AverageMethod.MACRO:
-                return torch.mean(torch.stack(auc_scores))
+                return torch.mean(auc_scores)
             if average == AverageMethod.WEIGHTED:
                 if mode == DataType.MULTILABEL:
                     support = torch.sum(target, dim=0)
                 else:
                     support = torch.bincount(target.flatten(), minlength=num_classes)
-                return torch.sum(torch.stack(auc_scores) * support / support.sum())
+                return torch.sum(auc_scores * support / support.sum())
 
             allowed_average = (AverageMethod.NONE.value, AverageMethod.MACRO.value, AverageMethod.WEIGHTED.value)
             raise ValueError(
@@ -17,8 +17,7 @@ import torch
 from torch import Tensor
 
 from torchmetrics.utilities import rank_zero_warn
-from torchmetrics.utilities.checks import _input_format_classification
-from torchmetrics.utilities.enums import DataType
+from torchmetrics.utilities.checks import _input_format_classification_labels
 
 
 def _confusion_matrix_update(
@@ -34,15 +33,13 @@ def _confusion_matrix_update(
         multilabel: determines if data is multilabel or not.
     """
 
-    preds, target, mode = _input_format_classification(preds, target, threshold)
-    if mode not in (DataType.BINARY, DataType.MULTILABEL):
-        preds = preds.argmax(dim=1)
-        target = target.argmax(dim=1)
+    # only labels are needed, so skip the one-hot encoding of multi-class inputs
+    preds, target, _ = _input_format_classification_labels(preds, target, threshold)
     if multilabel:
         unique_mapping = ((2 * target + preds) + 4 * torch.arange(num_classes, device=preds.device)).flatten()
         minlength = 4 * num_classes
     else:
-        unique_mapping = (target.view(-1) * num_classes + preds.view(-1)).to(torch.long)
+        unique_mapping = (target.reshape(-1) * num_classes + preds.reshape(-1)).to(torch.long)
         minlength = num_classes ** 2
 
     bins = torch.bincount(unique_mapping, minlength=minlength)
@@ -98,16 +95,23 @@ def _confusion_matrix_compute(confmat: Tensor, normalize: Optional[str] = None)
     if normalize is not None and normalize != "none":
         confmat = confmat.float() if not confmat.is_floating_point() else confmat
         if normalize == "true":
-            confmat = confmat / confmat.sum(axis=1, keepdim=True)
+            cm_sum = confmat.sum(axis=1, keepdim=True)
         elif normalize == "pred":
-            confmat = confmat / confmat.sum(axis=0, keepdim=True)
+            cm_sum = confmat.sum(axis=0, keepdim=True)
         elif normalize == "all":
-            confmat = confmat / confmat.sum()
-
-        nan_elements = confmat[torch.isnan(confmat)].nelement()
-        if nan_elements != 0:
-            confmat[torch.isnan(confmat)] = 0
-            rank_zero_warn(f"{nan_elements} nan values found in confusion matrix have been replaced with zeros.")
+            cm_sum = confmat.sum()
+
+        # empty rows/columns would produce nan values, divide them by one to get zeros instead
+        zero_sum = cm_sum == 0
+        confmat = confmat / cm_sum.masked_fill(zero_sum, 1)
+
+        # every element of an empty row/column is affected
+        empty_elements = int(zero_sum.sum()) * (confmat.numel() // cm_sum.numel())
+        if empty_elements != 0:
+            rank_zero_warn(
+                f"{empty_elements} elements of the confusion matrix belong to rows/columns that sum to zero"
+                " and have been set to zero during normalization."
+            )
     return confmat
 
 
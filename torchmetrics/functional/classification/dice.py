@@ -11,8 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Tuple
-
 import torch
 from torch import Tensor
 
@@ -20,44 +18,6 @@ from torchmetrics.utilities.data import to_categorical
 from torchmetrics.utilities.distributed import reduce
 
 
-def _stat_scores(
-    preds: Tensor,
-    target: Tensor,
-    class_index: int,
-    argmax_dim: int = 1,
-) -> Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]:
-    """Calculates the number of true positive, false positive, true negative and false negative for a specific
-    class.
-
-    Args:
-        preds: prediction tensor
-        target: target tensor
-        class_index: class to calculate over
-        argmax_dim: if pred is a tensor of probabilities, this indicates the
-            axis the argmax transformation will be applied over
-
-    Return:
-        True Positive, False Positive, True Negative, False Negative, Support
-
-    Example:
-        >>> x = torch.tensor([1, 2, 3])
-        >>> y = torch.tensor([0, 2, 3])
-        >>> tp, fp, tn, fn, sup = _stat_scores(x, y, class_index=1)
-        >>> tp, fp, tn, fn, sup
-        (tensor(0), tensor(1), tensor(2), tensor(0), tensor(0))
-    """
-    if preds.ndim == target.ndim + 1:
-        preds = to_categorical(preds, argmax_dim=argmax_dim)
-
-    tp = ((preds == class_index) * (target == class_index)).to(torch.long).sum()
-    fp = ((preds == class_index) * (target != class_index)).to(torch.long).sum()
-    tn = ((preds != class_index) * (target != class_index)).to(torch.long).sum()
-    fn = ((preds != class_index) * (target == class_index)).to(torch.long).sum()
-    sup = (target == class_index).to(torch.long).sum()
-
-    return tp, fp, tn, fn, sup
-
-
 def dice_score(
     preds: Tensor,
     target: Tensor,
@@ -95,18 +55,31 @@ def dice_score(
     """
     num_classes = preds.shape[1]
     bg_inv = 1 - int(bg)
-    scores = torch.zeros(num_classes - bg_inv, device=preds.device, dtype=torch.float32)
-    for i in range(bg_inv, num_classes):
-        if not (target == i).any():
-            # no foreground class
-            scores[i - bg_inv] += no_fg_score
-            continue
 
-        # TODO: rewrite to use general `stat_scores`
-        tp, fp, _, fn, _ = _stat_scores(preds=preds, target=target, class_index=i)
-        denom = (2 * tp + fp + fn).to(torch.float)
-        # nan result
-        score_cls = (2 * tp).to(torch.float) / denom if torch.is_nonzero(denom) else nan_score
-
-        scores[i - bg_inv] += score_cls
-    return reduce(scores, reduction=reduction)
+    # labels outside of the classes (e.g. an ignore label in target) share one extra bin,
+    # so they still count as false positives/negatives for the classes they are confused with
+    if preds.ndim == target.ndim + 1:
+        preds = to_categorical(preds, argmax_dim=1).flatten()
+    else:
+        preds = preds.flatten().long()
+        preds = preds.masked_fill((preds < 0) | (preds >= num_classes), num_classes)
+    target = target.flatten().long()
+    target = target.masked_fill((target < 0) | (target >= num_classes), num_classes)
+
+    # a single pass over the confusion matrix gives all per-class statistics
+    unique_mapping = target * (num_classes + 1) + preds
+    bins = torch.bincount(unique_mapping, minlength=(num_classes + 1) ** 2)
+    confmat = bins.reshape(num_classes + 1, num_classes + 1)
+
+    tp = confmat.diag()[:num_classes]
+    sup = confmat.sum(dim=1)[:num_classes]
+    fp = confmat.sum(dim=0)[:num_classes] - tp
+    fn = sup - tp
+
+    denom = (2 * tp + fp + fn).to(torch.float32)
+    # nan result
+    scores = torch.where(denom > 0, (2 * tp).to(torch.float32) / denom, torch.full_like(denom, nan_score))
+    # no foreground class
+    scores = torch.where(sup > 0, scores, torch.full_like(scores, no_fg_score))
+
+    return reduce(scores[bg_inv:], reduction=reduction)
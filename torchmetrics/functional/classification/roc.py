@@ -103,17 +103,18 @@ def _roc_compute_multi_class(
     """
 
     fpr, tpr, thresholds = [], [], []
+    multilabel = preds.shape == target.shape
     for cls in range(num_classes):
-        if preds.shape == target.shape:
+        if multilabel:
             target_cls = target[:, cls]
             pos_label = 1
         else:
             target_cls = target
             pos_label = cls
-        res = roc(
+        # inputs were already validated and flattened, so skip the checks of `roc` for each class
+        res = _roc_compute_single_class(
             preds=preds[:, cls],
             target=target_cls,
-            num_classes=1,
             pos_label=pos_label,
             sample_weights=sample_weights,
         )
@@ -61,16 +61,15 @@ def _stat_scores(
     elif reduce == "macro":
         dim = 0 if preds.ndim == 2 else 2
 
-    true_pred, false_pred = target == preds, target != preds
-    pos_pred, neg_pred = preds == 1, preds == 0
+    true_pred, pos_pred = target == preds, preds == 1
 
-    tp = (true_pred * pos_pred).sum(dim=dim)
-    fp = (false_pred * pos_pred).sum(dim=dim)
+    # inputs are binary, so the remaining statistics follow from tp and the mask sums
+    tp = (true_pred & pos_pred).sum(dim=dim)
+    fp = pos_pred.sum(dim=dim) - tp
+    tn = true_pred.sum(dim=dim) - tp
+    fn = true_pred.numel() // tp.numel() - tp - fp - tn
 
-    tn = (true_pred * neg_pred).sum(dim=dim)
-    fn = (false_pred * neg_pred).sum(dim=dim)
-
-    return tp.long(), fp.long(), tn.long(), fn.long()
+    return tp, fp, tn, fn
 
 
 def _stat_scores_update(
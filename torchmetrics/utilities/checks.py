@@ -16,7 +16,7 @@ from typing import Optional, Tuple
 import torch
 from torch import Tensor
 
-from torchmetrics.utilities.data import select_topk, to_onehot
+from torchmetrics.utilities.data import select_topk, to_categorical, to_onehot
 from torchmetrics.utilities.enums import DataType
 
 
@@ -293,6 +293,34 @@ def _input_squeeze(
     return preds, target
 
 
+def _input_squeeze_and_check(
+    preds: Tensor,
+    target: Tensor,
+    threshold: float,
+    num_classes: Optional[int],
+    multiclass: Optional[bool],
+    top_k: Optional[int],
+) -> Tuple[Tensor, Tensor, DataType]:
+    """Remove excess dimensions, upcast half precision preds and check the inputs for classification."""
+    # Remove excess dimensions
+    preds, target = _input_squeeze(preds, target)
+
+    # Convert half precision tensors to full precision, as not all ops are supported
+    # for example, min() is not supported
+    if preds.dtype == torch.float16:
+        preds = preds.float()
+
+    case = _check_classification_inputs(
+        preds,
+        target,
+        threshold=threshold,
+        num_classes=num_classes,
+        multiclass=multiclass,
+        top_k=top_k,
+    )
+    return preds, target, case
+
+
 def _input_format_classification(
     preds: Tensor,
     target: Tensor,
@@ -381,15 +409,7 @@ def _input_format_classification(
         case: The case the inputs fall in, one of ``'binary'``, ``'multi-class'``, ``'multi-label'`` or
             ``'multi-dim multi-class'``
     """
-    # Remove excess dimensions
-    preds, target = _input_squeeze(preds, target)
-
-    # Convert half precision tensors to full precision, as not all ops are supported
-    # for example, min() is not supported
-    if preds.dtype == torch.float16:
-        preds = preds.float()
-
-    case = _check_classification_inputs(
+    preds, target, case = _input_squeeze_and_check(
         preds,
         target,
         threshold=threshold,
@@ -432,6 +452,50 @@ def _input_format_classification(
     return preds.int(), target.int(), case
 
 
+def _input_format_classification_labels(
+    preds: Tensor,
+    target: Tensor,
+    threshold: float = 0.5,
+) -> Tuple[Tensor, Tensor, DataType]:
+    """Convert preds and target tensors into label tensors.
+
+    Inputs are validated in the same way as in ``_input_format_classification``, and binary and
+    multi-label inputs are formatted the same way. (Multi-dimensional) multi-class inputs are
+    however not one-hot encoded: probability preds are converted to the label with the highest
+    probability (the same entry ``select_topk`` picks for ``top_k=1``), and both preds and target
+    are returned as ``(N,)`` or ``(N, X)`` label tensors.
+
+    Args:
+        preds: Tensor with predictions (labels or probabilities)
+        target: Tensor with ground truth labels, always integers (labels)
+        threshold:
+            Threshold value for transforming probability/logit predictions to binary
+            (0 or 1) predictions, in the case of binary or multi-label inputs.
+
+    Returns:
+        preds: label tensor
+        target: label tensor
+        case: The case the inputs fall in, one of ``'binary'``, ``'multi-class'``, ``'multi-label'`` or
+            ``'multi-dim multi-class'``
+    """
+    preds, target, case = _input_squeeze_and_check(
+        preds, target, threshold=threshold, num_classes=None, multiclass=None, top_k=None
+    )
+
+    if case in (DataType.BINARY, DataType.MULTILABEL):
+        preds = (preds >= threshold).int()
+        target = target.reshape(target.shape[0], -1)
+        preds = preds.reshape(preds.shape[0], -1)
+    else:
+        if preds.is_floating_point():
+            preds = to_categorical(preds, argmax_dim=1)
+        if case == DataType.MULTIDIM_MULTICLASS:
+            target = target.reshape(target.shape[0], -1)
+            preds = preds.reshape(preds.shape[0], -1)
+
+    return preds.int(), target.int(), case
+
+
 def _input_format_classification_one_hot(
     num_classes: int,
     preds: Tensor,